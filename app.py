@@ -1,7 +1,21 @@
 import os
+import io
+import base64
+import hashlib
 import logging
+import math
+import queue
+import tempfile
+import threading
 import time
-from flask import Flask, render_template, request, jsonify, send_from_directory, redirect, url_for
+from datetime import datetime, timedelta
+from celery import Celery
+from flask import Flask, render_template, request, jsonify, send_from_directory, redirect, url_for, make_response
+from sqlalchemy import event, func, insert, inspect, null, select, text, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import load_only
+from werkzeug.datastructures import FileStorage
+from werkzeug.exceptions import RequestEntityTooLarge
 
 # Optional: load environment variables from .env for local development
 try:
@@ -19,7 +33,8 @@ from utils.speech_to_text import convert_speech_to_text
 from utils.text_to_gloss import convert_text_to_gloss
 from utils.video_retrieval import get_video_paths
 from utils.gratitude import is_gratitude
-from models import db, SignVideo, Translation, UserFeedback
+from models import db, Translation, TranslationVideo, UserFeedback, ensure_translation_search
+from cache import region, get_gloss_videos, load_sign_videos
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -41,59 +56,225 @@ if not database_url:
 
 logger.info(f"Using database URL: {database_url}")
 app.config["SQLALCHEMY_DATABASE_URI"] = database_url
-app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+engine_options = {
     "pool_recycle": 300,
     "pool_pre_ping": True,
+    # Size of the SQL compilation cache; hot statements differ only in bound values
+    "query_cache_size": 1200,
 }
+if database_url.startswith("sqlite"):
+    # Pooled SQLite connections move between threads, and writers wait for
+    # the lock instead of failing with "database is locked"
+    engine_options["connect_args"] = {"check_same_thread": False, "timeout": 30}
+if ":memory:" not in database_url and database_url not in ("sqlite://", "sqlite:///"):
+    # Enough connections for every gunicorn thread plus bursts; in-memory
+    # SQLite keeps Flask-SQLAlchemy's single shared StaticPool connection
+    engine_options["pool_size"] = 10
+    engine_options["max_overflow"] = 20
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+# Reject oversized uploads before they are read
+app.config["MAX_CONTENT_LENGTH"] = 25 * 1024 * 1024
 # Initialize the app with the extension
 db.init_app(app)
 
-# Ensure required directories exist
+# Tune SQLite for concurrent use: WAL lets reads proceed during writes and
+# commits no longer fsync the whole journal every time
+with app.app_context():
+    if db.engine.dialect.name == 'sqlite':
+        @event.listens_for(db.engine, 'connect')
+        def set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+            cursor.execute('PRAGMA mmap_size=268435456')
+            cursor.execute('PRAGMA cache_size=-64000')
+            cursor.close()
+
+# Configure the task queue used for speech recognition
+# Use REDIS_URL if provided, otherwise default to a local Redis instance
+redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+celery = Celery(app.name, broker=redis_url)
+# ASR tasks are long and uneven, so each worker process reserves one task at a
+# time; queued audio goes to whichever process frees up first
+celery.conf.worker_prefetch_multiplier = 1
+
+# Cache static SignVideo lookups in the same Redis instance. Short socket
+# timeouts make an unreachable Redis fail fast, so lookups fall back to the
+# database instead of stalling the request
+REDIS_CACHE_TIMEOUT = 0.5
+region.configure(
+    'dogpile.cache.redis',
+    expiration_time=3600,
+    arguments={
+        'url': redis_url,
+        'socket_timeout': REDIS_CACHE_TIMEOUT,
+        'connection_kwargs': {'socket_connect_timeout': REDIS_CACHE_TIMEOUT},
+    },
+)
+
+# Directory holding the sign videos
 video_directory = os.path.join(app.static_folder, 'videos')
-os.makedirs(video_directory, exist_ok=True)
 
-# Create database tables if they don't exist
-with app.app_context():
-    db.create_all()
+
+def init_storage():
+    """Create required directories and any missing database tables."""
+    os.makedirs(video_directory, exist_ok=True)
+    with app.app_context():
+        db.create_all()
+
+        # Tables created before video paths were stored get the column added in place
+        columns = {column['name'] for column in inspect(db.engine).get_columns('translation')}
+        if 'video_paths' not in columns:
+            with db.engine.begin() as connection:
+                connection.execute(text("ALTER TABLE translation ADD COLUMN video_paths JSON"))
+
+        with db.engine.begin() as connection:
+            ensure_translation_search(connection)
+
+
+@app.cli.command('init-db')
+def init_db_command():
+    """Set up the database and directories once per deployment."""
+    init_storage()
+    logger.info("Initialized database and video directory")
 
 @app.route('/')
 def index():
     """Render the main page of the application."""
     return render_template('index.html')
 
+# Upper bound on rows counted for history pagination; counting stops here
+# instead of scanning the whole table on every page load
+HISTORY_COUNT_CAP = 10000
+
+
+def fts_match_query(search):
+    """
+    Turn free-form search input into a safe FTS5 prefix query.
+    Returns an empty string when the input has no terms.
+    """
+    terms = ['"{}"*'.format(term.replace('"', '""')) for term in search.split()]
+    return ' '.join(terms)
+
+
+def search_history_fts(match_query, limit, offset):
+    """
+    Search translations through the SQLite FTS5 table with a query from fts_match_query.
+    Returns the page of translations and the (capped) number of matches.
+    """
+    params = {'q': match_query, 'n': limit, 'o': offset,
+              'cap': HISTORY_COUNT_CAP}
+    ids = db.session.execute(text(
+        "SELECT translation.id FROM translation_fts "
+        "JOIN translation ON translation.id = translation_fts.rowid "
+        "WHERE translation_fts MATCH :q "
+        "ORDER BY translation.timestamp DESC LIMIT :n OFFSET :o"), params).scalars().all()
+    total = db.session.execute(text(
+        "SELECT count(*) FROM (SELECT 1 FROM translation_fts "
+        "WHERE translation_fts MATCH :q LIMIT :cap)"), params).scalar()
+
+    # Load the rows by id, keeping the order returned by the search
+    rows = db.session.execute(select(Translation).where(Translation.id.in_(ids))).scalars()
+    by_id = {t.id: t for t in rows}
+    return [by_id[i] for i in ids if i in by_id], total
+
+
+def make_etag(*parts):
+    """Build a strong ETag from the values a page depends on."""
+    return hashlib.md5('-'.join(str(part) for part in parts).encode()).hexdigest()
+
+
+def translations_version():
+    """
+    Return (newest timestamp, pending count) for the translation table.
+    Together they change whenever a translation is added or a pending one finishes
+    (finishing does not touch the timestamp).
+    """
+    # Two queries so each is served by its own index (ix_translation_ts_desc
+    # and the partial ix_translation_pending) rather than one full scan
+    latest = db.session.scalar(select(func.max(Translation.timestamp)))
+    pending = db.session.scalar(
+        select(func.count()).select_from(Translation).where(Translation.is_successful.is_(None)))
+    return latest, pending
+
+
+def etag_response(etag, body):
+    """Wrap a page with its ETag; browsers must revalidate before reusing it."""
+    response = make_response(body)
+    response.set_etag(etag)
+    response.cache_control.max_age = 0
+    response.cache_control.must_revalidate = True
+    return response
+
+
 @app.route('/history')
 def history():
     """Show translation history from the database."""
-    page = request.args.get('page', 1, type=int)
+    page = max(request.args.get('page', 1, type=int), 1)
     per_page = 10
-    search = request.args.get('search', '')
-    
-    # Get translations from database
-    query = Translation.query
-    if search:
-        query = query.filter(Translation.original_text.ilike(f'%{search}%') | 
-                             Translation.gloss_text.ilike(f'%{search}%'))
+    offset = (page - 1) * per_page
+    search = request.args.get('search', '').strip()
+
+    # History only changes when a translation is added or a pending one finishes
+    latest, pending = translations_version()
+    etag = make_etag(latest, pending, page, search)
+    if request.if_none_match.contains(etag):
+        return etag_response(etag, ('', 304))
     
-    # Paginate results
-    paginated = query.order_by(Translation.timestamp.desc()).paginate(
-        page=page, per_page=per_page, error_out=False)
-    translations = paginated.items
-    total_pages = paginated.pages
+    translations = None
+    match_query = fts_match_query(search)
+    if match_query and db.engine.dialect.name == 'sqlite':
+        try:
+            translations, total = search_history_fts(match_query, per_page, offset)
+        except OperationalError as e:
+            # Databases created before the FTS table existed fall back to LIKE
+            if 'no such table' not in str(e.orig):
+                raise
+            logger.warning(f"Full-text search unavailable (run flask init-db), using LIKE: {e.orig}")
+            db.session.rollback()
+
+    if translations is None:
+        # Get translations from database; the search text, limit and offset are
+        # all bound parameters so every page reuses the same compiled statement.
+        # On PostgreSQL the ILIKE filters are served by the trigram indexes.
+        stmt = select(Translation)
+        if search:
+            pattern = f'%{search}%'
+            stmt = stmt.where(Translation.original_text.ilike(pattern) | 
+                              Translation.gloss_text.ilike(pattern))
+
+        translations = db.session.execute(
+            stmt.order_by(Translation.timestamp.desc()).limit(per_page).offset(offset)
+        ).scalars().all()
+        capped = stmt.with_only_columns(Translation.id).limit(HISTORY_COUNT_CAP).subquery()
+        total = db.session.scalar(select(func.count()).select_from(capped))
+
+    total_pages = math.ceil(total / per_page)
     
-    return render_template('history.html', 
+    return etag_response(etag, render_template('history.html', 
                           translations=translations, 
                           page=page, 
                           total_pages=total_pages,
-                          search=search)
+                          search=search))
 
 @app.route('/translation/<int:translation_id>')
 def view_translation(translation_id):
     """View details of a specific translation."""
-    translation = Translation.query.get_or_404(translation_id)
+    translation = db.get_or_404(Translation, translation_id)
     
     # Get feedback if it exists
     feedback = UserFeedback.query.filter_by(translation_id=translation_id).first()
+
+    # The page depends on this translation, its feedback and (through the
+    # related list) on other translations being added or finishing
+    latest, pending = translations_version()
+    etag = make_etag(translation.id, translation.is_successful, translation.gloss_text,
+                     feedback and feedback.accuracy_rating,
+                     feedback and feedback.comments, latest, pending)
+    if request.if_none_match.contains(etag):
+        return etag_response(etag, ('', 304))
     
     # Get related translations (with similar text)
     related_translations = []
@@ -102,30 +283,35 @@ def view_translation(translation_id):
         if words:
             # Use the first word for finding related translations
             search_term = words[0]
-            related_translations = Translation.query.filter(
-                Translation.id != translation_id,
-                Translation.original_text.ilike(f'%{search_term}%')
-            ).order_by(Translation.timestamp.desc()).limit(5).all()
+            # Only load the columns the related list shows
+            related_translations = db.session.execute(
+                select(Translation)
+                .options(load_only(Translation.id, Translation.original_text,
+                                   Translation.timestamp))
+                .where(Translation.id != translation_id,
+                       Translation.original_text.ilike(f'%{search_term}%'))
+                .order_by(Translation.timestamp.desc())
+                .limit(5)
+            ).scalars().all()
     
     # Get video models that match the gloss text
     videos = []
     if translation.gloss_text:
-        gloss_words = translation.gloss_text.split()
-        for word in gloss_words:
-            video = SignVideo.query.filter_by(gloss_word=word.lower()).first()
-            if video:
-                videos.append(video)
+        # Videos are linked when the translation is saved; rows saved before
+        # that fall back to resolving the gloss words
+        videos = ([link.sign_video for link in translation.video_links]
+                  or get_gloss_videos(translation.gloss_text.split()))
     
-    return render_template('view_translation.html', 
+    return etag_response(etag, render_template('view_translation.html', 
                           translation=translation,
                           feedback=feedback,
                           related_translations=related_translations,
-                          videos=videos)
+                          videos=videos))
 
 @app.route('/feedback/<int:translation_id>', methods=['POST'])
 def submit_feedback(translation_id):
     """Save user feedback for a translation."""
-    translation = Translation.query.get_or_404(translation_id)
+    translation = db.get_or_404(Translation, translation_id)
     
     try:
         # Get form data
@@ -160,15 +346,227 @@ def submit_feedback(translation_id):
         db.session.rollback()
         return "Error submitting feedback", 500
 
-@app.route('/process-audio', methods=['POST'])
-def process_audio():
+# Uploads up to this size are sent to the worker inline through the broker, so
+# a request holds at most the audio plus its base64 copy (about 2.3 MB) in memory.
+# Larger uploads are streamed to AUDIO_SPOOL_DIR and handed over by path; the
+# directory must be shared with every ASR worker (e.g. a common volume).
+# Without it they are rejected with 413.
+AUDIO_INLINE_LIMIT = 1_000_000
+audio_spool_dir = os.environ.get("AUDIO_SPOOL_DIR")
+
+
+def spool_audio(audio_file):
+    """Stream an upload into AUDIO_SPOOL_DIR and return the spooled file path."""
+    suffix = os.path.splitext(audio_file.filename or '')[1] or '.wav'
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix,
+                                     dir=audio_spool_dir) as tmp:
+        audio_file.save(tmp)
+        return tmp.name
+
+
+# A translation still pending after this long is reported as failed by /status,
+# so clients stop polling if its task was lost
+PENDING_TIMEOUT = timedelta(minutes=10)
+
+
+def save_translation_result(translation_id, original_text, gloss_text,
+                            is_successful, translation_time, video_links=(),
+                            video_paths=None):
+    """
+    Fill in a pending translation in a single short write transaction.
+    The row is only loaded here, so no transaction stays open while ASR runs.
+    video_links are (gloss position, sign video id) pairs to link to the translation.
+    """
+    translation = db.session.get(Translation, translation_id)
+    if translation is None:
+        logger.error(f"Translation {translation_id} vanished before it could be saved")
+        db.session.rollback()
+        return None
+
+    translation.original_text = original_text
+    translation.gloss_text = gloss_text
+    translation.is_successful = is_successful
+    translation.translation_time = translation_time
+    translation.video_paths = video_paths
+    db.session.add_all([
+        TranslationVideo(translation_id=translation_id, position=position,
+                         sign_video_id=sign_video_id)
+        for position, sign_video_id in video_links
+    ])
+    db.session.commit()
+    return translation.id
+
+
+# Errors raised while handling a request are written to the database by a
+# background thread, so a failing request never waits on (or is broken again
+# by) the database. Records are dropped if the queue fills up.
+ERROR_FLUSH_INTERVAL = 1.0
+_error_queue = queue.Queue(maxsize=1000)
+_error_writer = None
+_error_writer_lock = threading.Lock()
+
+
+def _write_errors():
+    """Drain queued error records and write them in batches."""
+    while True:
+        records = [_error_queue.get()]
+        time.sleep(ERROR_FLUSH_INTERVAL)
+        while True:
+            try:
+                records.append(_error_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        new_rows = [record for record in records if record['id'] is None]
+        pending_rows = [record for record in records if record['id'] is not None]
+        with app.app_context():
+            try:
+                if new_rows:
+                    db.session.execute(insert(Translation), [
+                        {key: value for key, value in record.items() if key != 'id'}
+                        for record in new_rows
+                    ])
+                if pending_rows:
+                    db.session.execute(update(Translation), pending_rows)
+                db.session.commit()
+            except Exception as e:
+                logger.error(f"Could not save {len(records)} errors to database: {str(e)}")
+                db.session.rollback()
+
+
+def record_error(message, translation_id=None):
+    """
+    Queue an error translation without blocking the caller.
+    With a translation_id the pending row is marked failed, otherwise a new row is added.
+    """
+    global _error_writer
+    with _error_writer_lock:
+        # Started lazily so each forked worker process gets its own thread
+        if _error_writer is None or not _error_writer.is_alive():
+            _error_writer = threading.Thread(target=_write_errors, daemon=True)
+            _error_writer.start()
+
+    try:
+        _error_queue.put_nowait({
+            'id': translation_id,
+            'original_text': f"Error: {message}",
+            'gloss_text': "",
+            'is_successful': False,
+            'translation_time': 0,
+        })
+    except queue.Full:
+        logger.warning(f"Error queue full; dropping error record: {message}")
+
+
+# Acknowledge only once the task finishes, so a task whose worker dies
+# mid-transcription is redelivered instead of lost
+@celery.task(queue='asr', acks_late=True, reject_on_worker_lost=True)
+def transcribe_task(audio_data, filename, content_type, translation_id, audio_path=None):
     """
-    Process the audio file sent from the client.
+    Run the slow part of the pipeline outside of the request thread.
     1. Convert speech to text
     2. Convert text to ISL gloss
     3. Retrieve video paths for the gloss terms
-    4. Save translation to database
+    4. Fill in the pending translation row created by process_audio
+    The audio arrives either inline (base64 audio_data) or as a spooled audio_path,
+    which is deleted once processing finishes.
     """
+    with app.app_context():
+        stream = None
+        try:
+            # A redelivered task may find its translation already saved
+            translation = db.session.get(Translation, translation_id)
+            if translation is not None and translation.is_successful is not None:
+                logger.info(f"Translation {translation_id} already processed; skipping")
+                return translation_id
+            db.session.rollback()
+
+            # Measure processing time
+            start_time = time.time()
+
+            # Rebuild a file object so the speech backend sees the same
+            # interface as a direct upload
+            if audio_path:
+                stream = open(audio_path, 'rb')
+            else:
+                stream = io.BytesIO(base64.b64decode(audio_data))
+            audio_file = FileStorage(stream=stream,
+                                     filename=filename,
+                                     content_type=content_type)
+
+            # Process the audio to get text
+            logger.debug("Processing audio file to text")
+            text = convert_speech_to_text(audio_file)
+
+            if not text:
+                logger.error("Speech recognition failed")
+                # Save failed translation to database
+                save_translation_result(translation_id, "Unknown", "", False, 0)
+                return None
+
+            # If user just said a gratitude phrase (e.g., "thank you"), treat specially
+            if is_gratitude(text):
+                logger.info("Detected gratitude utterance; skipping video retrieval")
+                # Save translation (optional) as a short gratitude record
+                return save_translation_result(translation_id, text, '[GRATITUDE]', True, 0)
+
+            # Convert text to ISL gloss
+            logger.debug(f"Converting text to gloss: {text}")
+            gloss = convert_text_to_gloss(text)
+
+            # Get video paths for the gloss terms; stored so /status never recomputes them
+            logger.debug(f"Retrieving videos for gloss: {gloss}")
+            video_paths = get_video_paths(gloss)
+
+            # Calculate processing time
+            process_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+
+            # Resolve the sign videos once so views can load them with a join.
+            # This reads the database directly: the links are permanent, so they
+            # must not depend on what the cache currently holds
+            gloss_words = [word.lower() for word in gloss]
+            unique_words = list(dict.fromkeys(gloss_words))
+            by_word = dict(zip(unique_words, load_sign_videos(unique_words)))
+            video_links = [(position, by_word[word].id)
+                           for position, word in enumerate(gloss_words) if by_word[word]]
+
+            # Save successful translation to database
+            save_translation_result(translation_id, text, " ".join(gloss), True, process_time,
+                                    video_links=video_links, video_paths=video_paths)
+            logger.info(f"Saved translation to database with ID: {translation_id}")
+
+            logger.info(f"Successfully processed audio. Text: '{text}', "
+                       f"Gloss terms: {len(gloss)}, Videos: {len(video_paths)}")
+            return translation_id
+
+        except Exception as e:
+            logger.error(f"Error processing audio: {str(e)}")
+            db.session.rollback()
+            try:
+                # Try to save error to database
+                save_translation_result(translation_id, f"Error: {str(e)}", "", False, 0)
+            except Exception as db_error:
+                logger.error(f"Could not save error to database: {str(db_error)}")
+            return None
+
+        finally:
+            if stream is not None:
+                stream.close()
+            if audio_path:
+                try:
+                    os.remove(audio_path)
+                except OSError as e:
+                    logger.warning(f"Could not remove spooled audio {audio_path}: {str(e)}")
+
+
+@app.route('/process-audio', methods=['POST'])
+def process_audio():
+    """
+    Accept the audio file sent from the client and queue it for transcription.
+    Returns 202 with a translation_id that can be polled via /status/<id>.
+    """
+    audio_path = None
+    translation_id = None
     try:
         # Check if the post request has the file part
         if 'audio' not in request.files:
@@ -179,119 +577,158 @@ def process_audio():
         logger.debug(f"Received audio file: {audio_file.filename}, "
                     f"content type: {audio_file.content_type}, "
                     f"mime type: {audio_file.mimetype}")
-        
-        # Measure processing time
-        start_time = time.time()
-        
-        # Process the audio to get text
-        logger.debug("Processing audio file to text")
-        text = convert_speech_to_text(audio_file)
-        
-        if not text:
-            logger.error("Speech recognition failed")
-            # Save failed translation to database
-            new_translation = Translation(
-                original_text="Unknown",
-                gloss_text="",
-                is_successful=False,
-                translation_time=0
-            )
-            db.session.add(new_translation)
-            db.session.commit()
-            
-            return jsonify({
-                'error': 'Could not recognize speech in the audio. '
-                         'Please speak clearly and ensure your microphone is working.'
-            }), 400
-        
-        # If user just said a gratitude phrase (e.g., "thank you"), treat specially
-        if is_gratitude(text):
-            logger.info("Detected gratitude utterance; skipping video retrieval")
-            # Save translation (optional) as a short gratitude record
-            new_translation = Translation(
-                original_text=text,
-                gloss_text='[GRATITUDE]',
-                is_successful=True,
-                translation_time=0
-            )
-            db.session.add(new_translation)
-            db.session.commit()
-
-            return jsonify({
-                'text': text,
-                'gloss': [],
-                'videos': [],
-                'translation_id': new_translation.id,
-                'is_gratitude': True
-            })
 
-        # Convert text to ISL gloss
-        logger.debug(f"Converting text to gloss: {text}")
-        gloss = convert_text_to_gloss(text)
+        # Large uploads go to the shared spool directory so neither this
+        # request nor the broker holds the whole recording in memory
+        audio_data = None
+        if audio_spool_dir and (request.content_length or 0) > AUDIO_INLINE_LIMIT:
+            audio_path = spool_audio(audio_file)
+        else:
+            # Read at most one byte past the limit to tell whether it fits
+            raw_audio = audio_file.read(AUDIO_INLINE_LIMIT + 1)
+            if len(raw_audio) <= AUDIO_INLINE_LIMIT:
+                # Audio is base64-encoded so it survives Celery's JSON serializer
+                audio_data = base64.b64encode(raw_audio).decode('ascii')
+            elif audio_spool_dir:
+                audio_file.stream.seek(0)
+                audio_path = spool_audio(audio_file)
+            else:
+                raise RequestEntityTooLarge()
 
-        # Get video paths for the gloss terms
-        logger.debug(f"Retrieving videos for gloss: {gloss}")
-        video_paths = get_video_paths(gloss)
-        
-        # Calculate processing time
-        process_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-        
-        # Save successful translation to database
-        gloss_text = " ".join(gloss)
+        # Create a pending translation; the worker fills it in when done.
+        # null() is needed because a plain None would fall back to the column default
         new_translation = Translation(
-            original_text=text,
-            gloss_text=gloss_text,
-            is_successful=True,
-            translation_time=process_time
+            original_text="",
+            gloss_text="",
+            is_successful=null(),
+            translation_time=0
         )
         db.session.add(new_translation)
         db.session.commit()
-        logger.info(f"Saved translation to database with ID: {new_translation.id}")
-        
-        # Successful response
-        logger.info(f"Successfully processed audio. Text: '{text}', "
-                   f"Gloss terms: {len(gloss)}, Videos: {len(video_paths)}")
-        
+        translation_id = new_translation.id
+
+        task = transcribe_task.delay(audio_data,
+                                     audio_file.filename,
+                                     audio_file.content_type,
+                                     translation_id,
+                                     audio_path=audio_path)
+        logger.info(f"Queued translation {translation_id} as task {task.id}")
+
         return jsonify({
-            'text': text,
-            'gloss': gloss,
-            'videos': video_paths,
-            'translation_id': new_translation.id
-        })
+            'translation_id': translation_id,
+            'task_id': task.id
+        }), 202
+
+    except RequestEntityTooLarge:
+        logger.error("Audio upload is too large")
+        return jsonify({'error': 'Audio file is too large'}), 413
         
     except Exception as e:
-        logger.error(f"Error processing audio: {str(e)}")
-        try:
-            # Try to save error to database
-            error_translation = Translation(
-                original_text=f"Error: {str(e)}",
-                gloss_text="",
-                is_successful=False,
-                translation_time=0
-            )
-            db.session.add(error_translation)
-            db.session.commit()
-        except Exception as db_error:
-            logger.error(f"Could not save error to database: {str(db_error)}")
-            
+        logger.error(f"Error queueing audio: {str(e)}")
+        db.session.rollback()
+        # Save error to database in the background
+        record_error(str(e), translation_id)
+        # The worker never got the spooled file, so clean it up here
+        if audio_path and os.path.exists(audio_path):
+            os.remove(audio_path)
         return jsonify({
             'error': f"An error occurred while processing your speech: {str(e)}"
         }), 500
 
 
+@app.route('/status/<int:translation_id>')
+def translation_status(translation_id):
+    """Report the progress of a translation queued by /process-audio."""
+    translation = db.get_or_404(Translation, translation_id)
+
+    if translation.is_successful is None:
+        if translation.timestamp < datetime.utcnow() - PENDING_TIMEOUT:
+            logger.warning(f"Translation {translation.id} still pending after {PENDING_TIMEOUT}")
+            return jsonify({
+                'status': 'FAILURE',
+                'translation_id': translation.id,
+                'error': 'Processing took too long. Please try again.'
+            })
+        return jsonify({
+            'status': 'PENDING',
+            'translation_id': translation.id
+        }), 202
+
+    if not translation.is_successful:
+        if translation.original_text == "Unknown":
+            error = ('Could not recognize speech in the audio. '
+                     'Please speak clearly and ensure your microphone is working.')
+        else:
+            error = 'An error occurred while processing your speech.'
+        return jsonify({
+            'status': 'FAILURE',
+            'translation_id': translation.id,
+            'error': error
+        })
+
+    if translation.gloss_text == '[GRATITUDE]':
+        return jsonify({
+            'status': 'SUCCESS',
+            'text': translation.original_text,
+            'gloss': [],
+            'videos': [],
+            'translation_id': translation.id,
+            'is_gratitude': True
+        })
+
+    gloss = translation.gloss_text.split()
+    # Translations saved before the worker stored video paths resolve them here
+    video_paths = translation.video_paths
+    if video_paths is None:
+        video_paths = get_video_paths(gloss)
+    return jsonify({
+        'status': 'SUCCESS',
+        'text': translation.original_text,
+        'gloss': gloss,
+        'videos': video_paths,
+        'translation_id': translation.id
+    })
+
+
 # Serve the avatar viewer and its static assets under /avatar
+# In production these are best served by the web server directly (see README)
+avatar_directory = os.path.join(os.path.dirname(__file__), 'avatar')
+
+# Avatar asset URLs are not versioned, so browsers only reuse them briefly and
+# then revalidate with the ETag (a 304 when the file is unchanged)
+AVATAR_ASSET_MAX_AGE = 300
+
+
 @app.route('/avatar/')
 def avatar_index():
     """Serve the avatar viewer index.html from the avatar folder."""
-    avatar_dir = os.path.join(os.path.dirname(__file__), 'avatar')
-    return send_from_directory(avatar_dir, 'index.html')
+    # Revalidated on every load so new deploys pick up new assets
+    return send_from_directory(avatar_directory, 'index.html', max_age=0)
 
 
 @app.route('/avatar/<path:filename>')
 def avatar_static(filename):
     """Serve files from the avatar folder (JS, glb, etc.)."""
-    avatar_dir = os.path.join(os.path.dirname(__file__), 'avatar')
-    return send_from_directory(avatar_dir, filename)
+    if filename == 'index.html':
+        return avatar_index()
+
+    # Prefer a precompressed .glb.gz when the client accepts gzip (q > 0)
+    gzip_name = filename + '.gz'
+    if (filename.endswith('.glb') and request.accept_encodings['gzip'] > 0
+            and os.path.isfile(os.path.join(avatar_directory, gzip_name))):
+        response = send_from_directory(avatar_directory, gzip_name,
+                                       mimetype='model/gltf-binary',
+                                       max_age=AVATAR_ASSET_MAX_AGE)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = send_from_directory(avatar_directory, filename,
+                                       max_age=AVATAR_ASSET_MAX_AGE)
+
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    return response
 
 if __name__ == '__main__':
+    # The dev server sets up storage itself; deployments run `flask init-db`
+    init_storage()
     app.run(host='0.0.0.0', port=5000, debug=True)
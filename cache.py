@@ -0,0 +1,55 @@
+import logging
+from collections import namedtuple
+
+from dogpile.cache import make_region
+from redis.exceptions import RedisError
+from sqlalchemy import select
+
+from models import db, SignVideo
+
+logger = logging.getLogger(__name__)
+
+
+# SignVideo rows are static reference data, so gloss lookups are cached.
+# The backend is configured by the app (see app.py).
+region = make_region()
+
+# Lightweight, picklable copy of a SignVideo row for storing in the cache
+SignVideoInfo = namedtuple('SignVideoInfo', ['id', 'gloss_word', 'file_path', 'duration'])
+
+
+def load_sign_videos(words):
+    """Query the database for one SignVideoInfo (or None) per lowercase gloss word."""
+    rows = db.session.execute(
+        select(SignVideo).where(SignVideo.gloss_word.in_(words))
+    ).scalars()
+    by_word = {row.gloss_word: SignVideoInfo(row.id, row.gloss_word, row.file_path, row.duration)
+               for row in rows}
+    return [by_word.get(word) for word in words]
+
+
+# Misses are not cached, so a newly added video is found on the next lookup
+@region.cache_multi_on_arguments(should_cache_fn=lambda video: video is not None)
+def get_sign_videos(*words):
+    """
+    Look up sign videos for lowercase gloss words.
+    Returns one SignVideoInfo (or None) per word; only cache misses reach the database.
+    Call get_sign_videos.invalidate(word) after changing a SignVideo row.
+    """
+    return load_sign_videos(words)
+
+
+def get_gloss_videos(words):
+    """Return the SignVideoInfo for each gloss word that has a video, in gloss order."""
+    words = [word.lower() for word in words]
+    unique_words = list(dict.fromkeys(words))
+    if not unique_words:
+        return []
+    try:
+        videos = get_sign_videos(*unique_words)
+    except RedisError as e:
+        # The cache is only an optimization; read straight from the database
+        logger.warning(f"Sign video cache unavailable, querying database: {str(e)}")
+        videos = load_sign_videos(unique_words)
+    by_word = dict(zip(unique_words, videos))
+    return [by_word[word] for word in words if by_word[word]]
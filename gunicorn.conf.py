@@ -0,0 +1,8 @@
+import os
+
+# Gunicorn settings, picked up automatically when gunicorn runs from this directory.
+# Request handlers mostly wait on the database, Redis and the filesystem (speech
+# recognition runs in the Celery worker), so each worker process serves several
+# requests at once on threads instead of one at a time.
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
@@ -1,7 +1,12 @@
+import logging
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import DDL, event, text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import DeclarativeBase
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 
 class Base(DeclarativeBase):
     pass
@@ -30,11 +35,95 @@ class Translation(db.Model):
     gloss_text = db.Column(db.Text, nullable=False)
     audio_path = db.Column(db.String(255), nullable=True)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
-    is_successful = db.Column(db.Boolean, default=True)
+    is_successful = db.Column(db.Boolean, default=True)  # None while still queued for ASR
     
     # Fields to store metrics
     recognition_confidence = db.Column(db.Float, nullable=True)
     translation_time = db.Column(db.Float, nullable=True)  # Time taken to process in ms
+    video_paths = db.Column(db.JSON, nullable=True)  # Paths from get_video_paths, stored by the worker
+
+    # Sign videos resolved when the translation was saved, in gloss order
+    video_links = db.relationship('TranslationVideo', order_by='TranslationVideo.position')
+
+    # History pages are always ordered newest first, and page ETags count the
+    # pending rows, which the partial index keeps small
+    __table_args__ = (
+        db.Index('ix_translation_ts_desc', timestamp.desc()),
+        db.Index('ix_translation_pending', 'id',
+                 sqlite_where=is_successful.is_(None),
+                 postgresql_where=is_successful.is_(None)),
+    )
+
+
+# On SQLite, mirror the searchable text columns into an FTS5 table so history
+# search can use MATCH instead of scanning every row with LIKE '%term%'.
+# The triggers keep the external-content index in sync with the translation table.
+_TRANSLATION_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS translation_fts USING fts5("
+    "original_text, gloss_text, content='translation', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS translation_fts_ai AFTER INSERT ON translation BEGIN "
+    "INSERT INTO translation_fts(rowid, original_text, gloss_text) "
+    "VALUES (new.id, new.original_text, new.gloss_text); END",
+    "CREATE TRIGGER IF NOT EXISTS translation_fts_ad AFTER DELETE ON translation BEGIN "
+    "INSERT INTO translation_fts(translation_fts, rowid, original_text, gloss_text) "
+    "VALUES ('delete', old.id, old.original_text, old.gloss_text); END",
+    "CREATE TRIGGER IF NOT EXISTS translation_fts_au AFTER UPDATE ON translation BEGIN "
+    "INSERT INTO translation_fts(translation_fts, rowid, original_text, gloss_text) "
+    "VALUES ('delete', old.id, old.original_text, old.gloss_text); "
+    "INSERT INTO translation_fts(rowid, original_text, gloss_text) "
+    "VALUES (new.id, new.original_text, new.gloss_text); END",
+)
+
+# On PostgreSQL, trigram GIN indexes let the existing ILIKE '%term%' filters
+# use an index instead of scanning every row. They are created by
+# ensure_translation_search, since the extension may need extra privileges.
+_TRANSLATION_TRGM_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_translation_original_text_trgm "
+    "ON translation USING gin (original_text gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_translation_gloss_text_trgm "
+    "ON translation USING gin (gloss_text gin_trgm_ops)",
+)
+
+for _statement in _TRANSLATION_FTS_DDL:
+    event.listen(Translation.__table__, 'after_create',
+                 DDL(_statement).execute_if(dialect='sqlite'))
+
+
+def ensure_translation_search(connection):
+    """
+    Add the history search objects to a translation table created before they
+    existed (after_create only fires for new tables) and index its current rows.
+    """
+    for index in Translation.__table__.indexes:
+        index.create(connection, checkfirst=True)
+
+    if connection.dialect.name == 'sqlite':
+        for statement in _TRANSLATION_FTS_DDL:
+            connection.execute(text(statement))
+        connection.execute(text("INSERT INTO translation_fts(translation_fts) VALUES ('rebuild')"))
+
+    elif connection.dialect.name == 'postgresql':
+        # A role without rights to create pg_trgm only loses the indexes;
+        # the savepoint keeps the rest of the setup transaction usable
+        try:
+            with connection.begin_nested():
+                for statement in _TRANSLATION_TRGM_DDL:
+                    connection.execute(text(statement))
+        except DBAPIError as e:
+            logger.warning(f"Could not create trigram indexes, search will scan: {e.orig}")
+
+
+class TranslationVideo(db.Model):
+    """
+    Model linking a translation to the sign video for each gloss word
+    """
+    translation_id = db.Column(db.Integer, db.ForeignKey('translation.id'), primary_key=True)
+    position = db.Column(db.Integer, primary_key=True)  # Index of the word in the gloss
+    sign_video_id = db.Column(db.Integer, db.ForeignKey('sign_video.id'), nullable=False)
+
+    # Relationship
+    sign_video = db.relationship('SignVideo', lazy='joined')
 
 
 class UserFeedback(db.Model):
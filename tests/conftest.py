@@ -0,0 +1,57 @@
+import os
+import sys
+import types
+
+import pytest
+from jinja2 import DictLoader
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def _install_utils_stubs():
+    """Provide minimal utils modules when the real pipeline is not installed."""
+    try:
+        import utils.speech_to_text  # noqa: F401
+        import utils.text_to_gloss  # noqa: F401
+        import utils.video_retrieval  # noqa: F401
+        import utils.gratitude  # noqa: F401
+        return
+    except ImportError:
+        pass
+
+    stubs = {
+        'utils.speech_to_text': {'convert_speech_to_text': lambda audio_file: None},
+        'utils.text_to_gloss': {'convert_text_to_gloss': lambda text: text.upper().split()},
+        'utils.video_retrieval': {'get_video_paths': lambda gloss: []},
+        'utils.gratitude': {'is_gratitude': lambda text: False},
+    }
+    sys.modules['utils'] = types.ModuleType('utils')
+    for name, attributes in stubs.items():
+        module = types.ModuleType(name)
+        module.__dict__.update(attributes)
+        sys.modules[name] = module
+
+
+@pytest.fixture(scope='session')
+def app_module(tmp_path_factory):
+    """Import the app against a temporary SQLite database and in-memory cache."""
+    database = tmp_path_factory.mktemp('db') / 'test.db'
+    os.environ['DATABASE_URL'] = f"sqlite:///{database}"
+    _install_utils_stubs()
+
+    import app as app_module
+    app_module.region.configure('dogpile.cache.memory', replace_existing_backend=True)
+    app_module.video_directory = str(tmp_path_factory.mktemp('videos'))
+    app_module.init_storage()
+
+    # The page templates are not needed to check caching headers
+    app_module.app.jinja_loader = DictLoader({
+        'history.html': '{% for t in translations %}{{ t.id }} {% endfor %}',
+        'view_translation.html': '{% for t in related_translations %}{{ t.id }} {% endfor %}',
+    })
+    return app_module
+
+
+@pytest.fixture
+def client(app_module):
+    return app_module.app.test_client()
@@ -0,0 +1,81 @@
+from sqlalchemy import null
+
+
+def add_translation(app_module, original_text, is_successful=True):
+    """Insert a translation row and return its id."""
+    with app_module.app.app_context():
+        translation = app_module.Translation(
+            original_text=original_text,
+            gloss_text=original_text.upper() if is_successful else "",
+            is_successful=null() if is_successful is None else is_successful,
+            translation_time=0
+        )
+        app_module.db.session.add(translation)
+        app_module.db.session.commit()
+        return translation.id
+
+
+def finish_translation(app_module, translation_id, original_text):
+    """Fill in a pending translation the way the worker does."""
+    with app_module.app.app_context():
+        app_module.save_translation_result(translation_id, original_text,
+                                           original_text.upper(), True, 0)
+
+
+def test_history_returns_304_when_unchanged(app_module, client):
+    add_translation(app_module, "good morning")
+
+    response = client.get('/history')
+    assert response.status_code == 200
+    assert response.headers['ETag']
+
+    cached = client.get('/history', headers={'If-None-Match': response.headers['ETag']})
+    assert cached.status_code == 304
+
+
+def test_history_etag_changes_when_pending_translation_finishes(app_module, client):
+    pending_id = add_translation(app_module, "", is_successful=None)
+    etag = client.get('/history').headers['ETag']
+
+    finish_translation(app_module, pending_id, "see you later")
+
+    response = client.get('/history', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_translation_returns_304_when_unchanged(app_module, client):
+    translation_id = add_translation(app_module, "nice to meet you")
+
+    response = client.get(f'/translation/{translation_id}')
+    assert response.status_code == 200
+
+    cached = client.get(f'/translation/{translation_id}',
+                        headers={'If-None-Match': response.headers['ETag']})
+    assert cached.status_code == 304
+
+
+def test_translation_etag_changes_when_related_translation_finishes(app_module, client):
+    # Queue B, then save A; B's timestamp is older than A's and never changes
+    pending_id = add_translation(app_module, "", is_successful=None)
+    translation_id = add_translation(app_module, "welcome home")
+
+    response = client.get(f'/translation/{translation_id}')
+    etag = response.headers['ETag']
+    assert str(pending_id) not in response.get_data(as_text=True).split()
+
+    finish_translation(app_module, pending_id, "welcome back")
+
+    response = client.get(f'/translation/{translation_id}', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert str(pending_id) in response.get_data(as_text=True).split()
+
+
+def test_translation_etag_changes_with_feedback(app_module, client):
+    translation_id = add_translation(app_module, "how are you")
+    etag = client.get(f'/translation/{translation_id}').headers['ETag']
+
+    client.post(f'/feedback/{translation_id}', data={'rating': '4', 'comments': 'close'})
+
+    response = client.get(f'/translation/{translation_id}', headers={'If-None-Match': etag})
+    assert response.status_code == 200
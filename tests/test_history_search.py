@@ -0,0 +1,49 @@
+import logging
+
+from sqlalchemy import text
+
+
+def add_translation(app_module, original_text):
+    """Insert a finished translation and return its id."""
+    with app_module.app.app_context():
+        translation = app_module.Translation(original_text=original_text,
+                                             gloss_text=original_text.upper(),
+                                             translation_time=0)
+        app_module.db.session.add(translation)
+        app_module.db.session.commit()
+        return translation.id
+
+
+def shown_ids(response):
+    return {int(word) for word in response.get_data(as_text=True).split()}
+
+
+def test_search_matches_word_prefixes(app_module, client):
+    match_id = add_translation(app_module, "where is the railway station")
+    other_id = add_translation(app_module, "what time is it")
+
+    ids = shown_ids(client.get('/history?search=rail'))
+    assert match_id in ids
+    assert other_id not in ids
+
+
+def test_blank_search_lists_all_translations(app_module, client, caplog):
+    translation_id = add_translation(app_module, "nice to meet you")
+
+    with caplog.at_level(logging.WARNING):
+        response = client.get('/history?search=%20%20')
+
+    assert response.status_code == 200
+    assert translation_id in shown_ids(response)
+    assert 'Full-text search unavailable' not in caplog.text
+
+
+def test_search_falls_back_to_like_without_fts_table(app_module, client):
+    translation_id = add_translation(app_module, "happy birthday")
+    with app_module.app.app_context():
+        with app_module.db.engine.begin() as connection:
+            connection.execute(text("DROP TABLE translation_fts"))
+    try:
+        assert translation_id in shown_ids(client.get('/history?search=birthday'))
+    finally:
+        app_module.init_storage()
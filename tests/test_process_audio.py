@@ -0,0 +1,130 @@
+import io
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from kombu.exceptions import OperationalError as BrokerError
+
+
+@pytest.fixture
+def eager(app_module, monkeypatch):
+    """Run queued tasks inline, with a speech backend that echoes the audio bytes."""
+    monkeypatch.setattr(app_module.celery.conf, 'task_always_eager', True)
+    monkeypatch.setattr(app_module, 'convert_speech_to_text',
+                        lambda audio_file: audio_file.read().decode() or None)
+    monkeypatch.setattr(app_module, 'get_video_paths',
+                        lambda gloss: [f"/static/videos/{word.lower()}.mp4" for word in gloss])
+    return app_module
+
+
+def post_audio(client, body):
+    return client.post('/process-audio',
+                       data={'audio': (io.BytesIO(body), 'speech.wav')},
+                       content_type='multipart/form-data')
+
+
+def test_queued_translation_reports_success(eager, client):
+    response = post_audio(client, b"good night")
+    assert response.status_code == 202
+
+    status = client.get(f"/status/{response.json['translation_id']}")
+    assert status.status_code == 200
+    assert status.json['status'] == 'SUCCESS'
+    assert status.json['gloss'] == ['GOOD', 'NIGHT']
+    assert status.json['videos'] == ['/static/videos/good.mp4', '/static/videos/night.mp4']
+
+
+def test_unrecognized_speech_reports_failure(eager, client):
+    response = post_audio(client, b"")
+    assert response.status_code == 202
+
+    status = client.get(f"/status/{response.json['translation_id']}")
+    assert status.json['status'] == 'FAILURE'
+    assert 'Could not recognize speech' in status.json['error']
+
+
+def add_pending(app_module, age):
+    """Insert a pending translation created `age` ago and return its id."""
+    with app_module.app.app_context():
+        translation = app_module.Translation(
+            original_text="", gloss_text="", is_successful=app_module.null(),
+            translation_time=0, timestamp=datetime.utcnow() - age)
+        app_module.db.session.add(translation)
+        app_module.db.session.commit()
+        return translation.id
+
+
+def test_pending_translation_reports_pending(app_module, client):
+    status = client.get(f"/status/{add_pending(app_module, timedelta(0))}")
+    assert status.status_code == 202
+    assert status.json['status'] == 'PENDING'
+
+
+def test_pending_translation_times_out(app_module, client):
+    translation_id = add_pending(app_module, app_module.PENDING_TIMEOUT * 2)
+
+    status = client.get(f"/status/{translation_id}")
+    assert status.status_code == 200
+    assert status.json['status'] == 'FAILURE'
+
+
+def test_redelivered_task_keeps_saved_translation(eager, client):
+    translation_id = post_audio(client, b"thank god").json['translation_id']
+
+    # A redelivered copy of the task must not overwrite the saved result
+    eager.transcribe_task.apply(args=(None, 'speech.wav', 'audio/wav', translation_id))
+
+    status = client.get(f"/status/{translation_id}")
+    assert status.json['status'] == 'SUCCESS'
+    assert status.json['gloss'] == ['THANK', 'GOD']
+
+
+def test_broker_down_marks_translation_failed(eager, client, monkeypatch):
+    def broker_down(*args, **kwargs):
+        raise BrokerError("Error 111 connecting to localhost:6379. Connection refused.")
+
+    monkeypatch.setattr(eager.transcribe_task, 'delay', broker_down)
+    monkeypatch.setattr(eager, 'ERROR_FLUSH_INTERVAL', 0)
+
+    response = post_audio(client, b"hello")
+    assert response.status_code == 500
+
+    # The failure is written by the background error writer
+    with eager.app.app_context():
+        translation_id = eager.db.session.scalar(
+            eager.select(eager.func.max(eager.Translation.id)))
+    deadline = time.time() + 5
+    status = client.get(f"/status/{translation_id}")
+    while status.json['status'] == 'PENDING' and time.time() < deadline:
+        time.sleep(0.05)
+        status = client.get(f"/status/{translation_id}")
+    assert status.json['status'] == 'FAILURE'
+
+
+def test_large_upload_without_spool_dir_is_rejected(eager, client, monkeypatch):
+    monkeypatch.setattr(eager, 'AUDIO_INLINE_LIMIT', 8)
+    monkeypatch.setattr(eager, 'audio_spool_dir', None)
+    with eager.app.app_context():
+        before = eager.db.session.scalar(eager.select(eager.func.count(eager.Translation.id)))
+
+    response = post_audio(client, b"a rather long recording")
+    assert response.status_code == 413
+
+    # Nothing is queued, so no pending translation is left behind
+    with eager.app.app_context():
+        after = eager.db.session.scalar(eager.select(eager.func.count(eager.Translation.id)))
+    assert after == before
+
+
+def test_large_upload_is_spooled_to_disk(eager, client, monkeypatch, tmp_path):
+    monkeypatch.setattr(eager, 'AUDIO_INLINE_LIMIT', 8)
+    monkeypatch.setattr(eager, 'audio_spool_dir', str(tmp_path))
+
+    response = post_audio(client, b"a rather long recording")
+    assert response.status_code == 202
+
+    status = client.get(f"/status/{response.json['translation_id']}")
+    assert status.json['status'] == 'SUCCESS'
+    assert status.json['gloss'] == ['A', 'RATHER', 'LONG', 'RECORDING']
+    # The worker removes the spooled file once it is done
+    assert list(tmp_path.iterdir()) == []